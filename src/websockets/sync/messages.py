@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 import codecs
-import queue
+import collections
 import threading
-from typing import Any, Callable, Iterable, Iterator
+from typing import Any, Callable, Iterator
 
 from ..exceptions import ConcurrencyError
 from ..frames import OP_BINARY, OP_CONT, OP_TEXT, Frame
@@ -31,6 +31,19 @@ class Assembler:
 
     """
 
+    __slots__ = [
+        "mutex",
+        "frames",
+        "not_empty",
+        "high",
+        "low",
+        "pause",
+        "resume",
+        "paused",
+        "get_in_progress",
+        "closed",
+    ]
+
     def __init__(
         self,
         high: int = 16,
@@ -38,12 +51,16 @@ class Assembler:
         pause: Callable[[], Any] = lambda: None,
         resume: Callable[[], Any] = lambda: None,
     ) -> None:
-        # Serialize reads and writes -- except for reads via synchronization
-        # primitives provided by the threading and queue modules.
+        # Serialize reads and writes.
         self.mutex = threading.Lock()
 
         # Queue of incoming frames.
-        self.frames: queue.SimpleQueue[Frame | None] = queue.SimpleQueue()
+        self.frames: collections.deque[Frame] = collections.deque()
+
+        # Wake up get() or get_iter() when a frame arrives or the stream ends.
+        # This condition is created once and shares self.mutex, so waiting for
+        # a frame and popping it happen in the same critical section.
+        self.not_empty = threading.Condition(self.mutex)
 
         # We cannot put a hard limit on the size of the queue because a single
         # call to Protocol.data_received() could produce thousands of frames,
@@ -69,32 +86,27 @@ class Assembler:
     def get_next_frame(self, timeout: float | None = None) -> Frame:
         # Helper to factor out the logic for getting the next frame from the
         # queue, while handling timeouts and reaching the end of the stream.
-        try:
-            frame = self.frames.get(timeout=timeout)
-        except queue.Empty:
-            raise TimeoutError(f"timed out in {timeout:.1f}s") from None
-        if frame is None:
-            raise EOFError("stream of frames ended")
+        with self.mutex:
+            if not self.frames and not self.closed:
+                if not self.not_empty.wait_for(
+                    lambda: self.frames or self.closed,
+                    timeout,
+                ):
+                    # wait_for() returns immediately when timeout <= 0.
+                    assert timeout is not None
+                    raise TimeoutError(f"timed out in {max(timeout, 0):.1f}s")
+            if not self.frames:
+                raise EOFError("stream of frames ended")
+            frame = self.frames.popleft()
+            self.maybe_resume()
         return frame
 
-    def reset_queue(self, frames: Iterable[Frame]) -> None:
+    def reset_queue(self, frames: list[Frame]) -> None:
         # Helper to put frames back into the queue after they were fetched.
-        # This happens only when the queue is empty. However, by the time
-        # we acquire self.mutex, put() may have added items in the queue.
-        # Therefore, we must handle the case where the queue is not empty.
-        frame: Frame | None
+        # By the time we acquire self.mutex, put() may have added items in
+        # the queue. Putting frames back at the front preserves ordering.
         with self.mutex:
-            queued = []
-            try:
-                while True:
-                    queued.append(self.frames.get_nowait())
-            except queue.Empty:
-                pass
-            for frame in frames:
-                self.frames.put(frame)
-            # This loop runs only when a race condition occurs.
-            for frame in queued:  # pragma: no cover
-                self.frames.put(frame)
+            self.frames.extendleft(reversed(frames))
 
     def get(self, timeout: float | None = None, decode: bool | None = None) -> Data:
         """
@@ -136,9 +148,9 @@ class Assembler:
             deadline = Deadline(timeout)
 
             # First frame
-            frame = self.get_next_frame(deadline.timeout())
-            with self.mutex:
-                self.maybe_resume()
+            # If the deadline lapsed, return frames that are already received
+            # rather than timing out. This makes get(timeout=0) non-blocking.
+            frame = self.get_next_frame(deadline.timeout(raise_if_elapsed=False))
             assert frame.opcode is OP_TEXT or frame.opcode is OP_BINARY
             if decode is None:
                 decode = frame.opcode is OP_TEXT
@@ -147,14 +159,14 @@ class Assembler:
             # Following frames, for fragmented messages
             while not frame.fin:
                 try:
-                    frame = self.get_next_frame(deadline.timeout())
+                    frame = self.get_next_frame(
+                        deadline.timeout(raise_if_elapsed=False)
+                    )
                 except TimeoutError:
                     # Put frames already received back into the queue
                     # so that future calls to get() can return them.
                     self.reset_queue(frames)
                     raise
-                with self.mutex:
-                    self.maybe_resume()
                 assert frame.opcode is OP_CONT
                 frames.append(frame)
 
@@ -210,8 +222,6 @@ class Assembler:
 
         # First frame
         frame = self.get_next_frame()
-        with self.mutex:
-            self.maybe_resume()
         assert frame.opcode is OP_TEXT or frame.opcode is OP_BINARY
         if decode is None:
             decode = frame.opcode is OP_TEXT
@@ -224,8 +234,6 @@ class Assembler:
         # Following frames, for fragmented messages
         while not frame.fin:
             frame = self.get_next_frame()
-            with self.mutex:
-                self.maybe_resume()
             assert frame.opcode is OP_CONT
             if decode:
                 yield decoder.decode(frame.data, frame.fin)
@@ -246,7 +254,8 @@ class Assembler:
             if self.closed:
                 raise EOFError("stream of frames ended")
 
-            self.frames.put(frame)
+            self.frames.append(frame)
+            self.not_empty.notify()
             self.maybe_pause()
 
     # put() and get/get_iter() call maybe_pause() and maybe_resume() while
@@ -254,16 +263,11 @@ class Assembler:
     # Specifically, it prevents a race condition where maybe_resume() would
     # run before maybe_pause(), leaving the connection incorrectly paused.
 
-    # A race condition is possible when get/get_iter() call self.frames.get()
-    # without holding self.mutex. However, it's harmless — and even beneficial!
-    # It can only result in popping an item from the queue before maybe_resume()
-    # runs and skipping a pause() - resume() cycle that would otherwise occur.
-
     def maybe_pause(self) -> None:
         """Pause the writer if queue is above the high water mark."""
         assert self.mutex.locked()
         # Check for "> high" to support high = 0
-        if self.frames.qsize() > self.high and not self.paused:
+        if len(self.frames) > self.high and not self.paused:
             self.paused = True
             self.pause()
 
@@ -271,7 +275,7 @@ class Assembler:
         """Resume the writer if queue is below the low water mark."""
         assert self.mutex.locked()
         # Check for "<= low" to support low = 0
-        if self.frames.qsize() <= self.low and self.paused:
+        if len(self.frames) <= self.low and self.paused:
             self.paused = False
             self.resume()
 
@@ -290,4 +294,4 @@ class Assembler:
             self.closed = True
 
             # Unblock get() or get_iter().
-            self.frames.put(None)
+            self.not_empty.notify()
@@ -185,6 +185,38 @@ class AssemblerTests(ThreadTestCase):
         message = self.assembler.get()
         self.assertEqual(message, "café")
 
+    def test_get_with_zero_timeout_message_already_received(self):
+        """get with timeout=0 returns a message that is already received."""
+        self.assembler.put(Frame(OP_TEXT, b"caf\xc3\xa9"))
+        message = self.assembler.get(timeout=0)
+        self.assertEqual(message, "café")
+
+    def test_get_with_zero_timeout_fragmented_message_already_received(self):
+        """get with timeout=0 reassembles a message that is already received."""
+        self.assembler.put(Frame(OP_TEXT, b"ca", fin=False))
+        self.assembler.put(Frame(OP_CONT, b"f\xc3", fin=False))
+        self.assembler.put(Frame(OP_CONT, b"\xa9"))
+        message = self.assembler.get(timeout=0)
+        self.assertEqual(message, "café")
+
+    def test_get_with_zero_timeout_message_not_received_yet(self):
+        """get with timeout=0 times out when no message is received."""
+        with self.assertRaises(TimeoutError):
+            self.assembler.get(timeout=0)
+
+    def test_get_with_zero_timeout_fragmented_message_being_received(self):
+        """get with timeout=0 times out when a message is partially received."""
+        self.assembler.put(Frame(OP_TEXT, b"ca", fin=False))
+
+        with self.assertRaises(TimeoutError):
+            self.assembler.get(timeout=0)
+
+        self.assembler.put(Frame(OP_CONT, b"f\xc3", fin=False))
+        self.assembler.put(Frame(OP_CONT, b"\xa9"))
+
+        message = self.assembler.get(timeout=0)
+        self.assertEqual(message, "café")
+
     # Test get_iter
 
     def test_get_iter_text_message_already_received(self):